@@ -4,7 +4,56 @@ Golden Test Case Runner for DNA Storage Code Definitions
 Verifies the definitions_lib against known test cases
 """
 
+import functools
+import io
 import json
+import operator
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+# Suites at least this large are dispatched across a process pool; below it
+# the pool spawn cost outweighs the parallel win
+_PARALLEL_MIN_CASES = 64
+
+# Separator lines, built once at import time
+_EQ80 = "=" * 80
+_DASH80 = "-" * 80
+
+# Set False to skip retaining per-failure details entirely (e.g. CI gate
+# runs that only consume the exit code)
+CAPTURE_ERRORS = True
+
+# C-level multi-key accessors: one call instead of several __getitem__s
+_GET_CASE = operator.itemgetter('id', 'input', 'expect')
+_GET_SUITE = operator.itemgetter('suite_name', 'parameters', 'cases')
+_GET_PARAMS = operator.itemgetter('l', 'delta')
+
+# orjson is optional; it parses large golden files at C speed
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    _ORJSON_AVAILABLE = False
+
+# NumPy is optional; without it the per-case fallback path is used
+try:
+    import numpy as np
+    _NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    _NUMPY_AVAILABLE = False
+
+# Numba is optional; without it (or NumPy) the pure-Python checker is used
+try:
+    import numba
+    _NUMBA_AVAILABLE = _NUMPY_AVAILABLE
+except ImportError:
+    numba = None
+    _NUMBA_AVAILABLE = False
 
 # Import the checker
 try:
@@ -15,62 +64,198 @@ except ImportError:
     exit(1)
 
 
+if _NUMBA_AVAILABLE:
+    @numba.njit(cache=True)
+    def _locally_balanced_numba(arr, l, delta):
+        """
+        Compiled O(n) running-sum window check over a uint8 0/1 array
+
+        Returns:
+            (is_balanced, first_violation_idx) tuple; the index is -1 when
+            the word is balanced
+        """
+        n = arr.shape[0]
+        lower_bound = l // 2 - delta
+        upper_bound = l // 2 + delta
+
+        if n < l:
+            return True, -1
+
+        w = 0
+        for i in range(l):
+            w += arr[i]
+        if w < lower_bound or w > upper_bound:
+            return False, 0
+
+        for i in range(l, n):
+            w += arr[i]
+            w -= arr[i - l]
+            if w < lower_bound or w > upper_bound:
+                return False, i - l + 1
+
+        return True, -1
+
+
+@dataclass(slots=True)
+class TestResult:
+    """
+    Outcome of a single test case
+
+    Fixed slotted layout instead of a per-case dict: cheaper to build and
+    smaller to retain across large suites.
+    """
+    id: str
+    input: str
+    length: int
+    expected: bool
+    actual: Optional[bool]
+    passed: bool
+    note: str
+    violations: Optional[list]
+    error: Optional[str] = None
+
+    def to_dict(self):
+        """Convert to a plain dict for JSON-style reporting"""
+        return asdict(self)
+
+
+# Per-process checker set up by _init_worker in pool workers; _run_one falls
+# back to it so the checker (and its memoization cache) is built once per
+# worker instead of being re-pickled or re-created per task
+_CHECKER = None
+
+
+def _init_worker():
+    """Initialize a pool worker: build its checker and pay JIT warmup once"""
+    global _CHECKER
+    _CHECKER = DNAStorageCodeChecker()
+    if _NUMBA_AVAILABLE:
+        _locally_balanced_numba(np.zeros(16, dtype=np.uint8), 4, 2)
+
+
+def _run_one(case, l, delta, checker=None, precomputed=None, collect_violations=True):
+    """
+    Check a single case and build its TestResult
+
+    Top-level (picklable) so process-pool workers can run it directly;
+    TestRunner.run_test_case delegates here.
+
+    Args:
+        case: Test case dictionary with 'id', 'input', 'expect', 'note'
+        l: Window length parameter
+        delta: Balance tolerance parameter
+        checker: DNAStorageCodeChecker to use; when omitted the worker's
+            shared checker (or a fresh one) is used
+        precomputed: Optional (is_balanced, violations) tuple from a
+            batched checker call, skipping the per-case invocation
+        collect_violations: When False, only pass/fail is computed and
+            TestResult.violations stays None
+
+    Returns:
+        (passed, details) tuple
+    """
+    if checker is None:
+        checker = _CHECKER if _CHECKER is not None else DNAStorageCodeChecker()
+
+    test_id, input_str, expected = _GET_CASE(case)
+    note = case.get('note', '')
+
+    # Checker faults come back through the sentinel error slot rather than
+    # as exceptions, so no per-case handler frame is set up; anything a
+    # checker cannot catch itself surfaces at suite level instead
+    error = None
+    arr = case.get('_arr')
+    if precomputed is not None:
+        is_balanced, violations = precomputed
+    elif _NUMBA_AVAILABLE:
+        if arr is None:
+            arr = np.frombuffer(input_str.encode('ascii'), dtype=np.uint8) - 48
+        # Compiled fast path answers pass/fail; the full violation
+        # list is only recovered for the (rare) failing words
+        is_balanced, _first_bad = _locally_balanced_numba(arr, l, delta)
+        if is_balanced or not collect_violations:
+            violations = None
+        else:
+            _, violations, error = checker.is_locally_balanced_cached(
+                input_str, l, delta, max_violations=None)
+    elif arr is not None:
+        is_balanced, violations = checker.is_locally_balanced_arr(
+            arr, l, delta, max_violations=None, collect=collect_violations)
+    else:
+        # Encode once: the checker's fallback loop indexes bytes directly
+        is_balanced, violations, error = checker.is_locally_balanced_cached(
+            input_str.encode('ascii'), l, delta, max_violations=None,
+            collect=collect_violations)
+
+    if error is not None:
+        details = TestResult(
+            id=test_id,
+            input=input_str,
+            length=len(input_str),
+            expected=expected,
+            actual=None,
+            passed=False,
+            note=note,
+            violations=None,
+            error=error
+        )
+        return False, details
+
+    # Check if result matches expectation
+    passed = (is_balanced == expected)
+
+    details = TestResult(
+        id=test_id,
+        input=input_str,
+        length=len(input_str),
+        expected=expected,
+        actual=is_balanced,
+        passed=passed,
+        note=note,
+        violations=violations if violations else None
+    )
+
+    return passed, details
+
+
 class TestRunner:
     """Runner for golden test cases"""
     
-    def __init__(self):
+    def __init__(self, verbose=True, collect_violations=True):
         self.checker = DNAStorageCodeChecker()
         self.passed = 0
         self.failed = 0
         self.errors = []
+        self.verbose = verbose
+        # When False the checkers stop at the first violation and skip
+        # building messages entirely (pass/fail-only runs, e.g. CI)
+        self.collect_violations = collect_violations
+        # Suite output is accumulated here and flushed in one write, instead
+        # of issuing several print calls per case
+        self._out = io.StringIO()
+
+        # Warm up the JIT on a dummy input so compile cost is paid here,
+        # not inside the first test case
+        if _NUMBA_AVAILABLE:
+            _locally_balanced_numba(np.zeros(16, dtype=np.uint8), 4, 2)
     
-    def run_test_case(self, case, l, delta):
+    def run_test_case(self, case, l, delta, precomputed=None):
         """
         Run a single test case
-        
+
         Args:
             case: Test case dictionary with 'id', 'input', 'expect', 'note'
             l: Window length parameter
             delta: Balance tolerance parameter
-        
+            precomputed: Optional (is_balanced, violations) tuple from a
+                batched checker call, skipping the per-case invocation
+
         Returns:
             (passed, details) tuple
         """
-        test_id = case['id']
-        input_str = case['input']
-        expected = case['expect']
-        note = case.get('note', '')
-        
-        try:
-            # Run the checker
-            is_balanced, violations = self.checker.is_locally_balanced(input_str, l, delta)
-            
-            # Check if result matches expectation
-            passed = (is_balanced == expected)
-            
-            details = {
-                'id': test_id,
-                'input': input_str,
-                'length': len(input_str),
-                'expected': expected,
-                'actual': is_balanced,
-                'passed': passed,
-                'note': note,
-                'violations': violations if violations else None
-            }
-            
-            return passed, details
-            
-        except Exception as e:
-            details = {
-                'id': test_id,
-                'input': input_str,
-                'expected': expected,
-                'error': str(e),
-                'passed': False
-            }
-            return False, details
-    
+        return _run_one(case, l, delta, self.checker, precomputed,
+                        self.collect_violations)
+
     def run_test_suite(self, suite):
         """
         Run an entire test suite
@@ -81,65 +266,122 @@ class TestRunner:
         Returns:
             Dictionary with suite results
         """
-        suite_name = suite['suite_name']
-        params = suite['parameters']
-        l = params['l']
-        delta = params['delta']
-        cases = suite['cases']
+        suite_name, params, cases = _GET_SUITE(suite)
+        l, delta = _GET_PARAMS(params)
         
-        print("\n" + "=" * 80)
-        print("Running Test Suite: {0}".format(suite_name))
-        print("Parameters: l={0}, delta={1}".format(l, delta))
-        print("=" * 80)
+        out = self._out
+        out.write("\n" + _EQ80 + "\n")
+        out.write(f"Running Test Suite: {suite_name}\n")
+        out.write(f"Parameters: l={l}, delta={delta}\n")
+        out.write(_EQ80 + "\n")
         
-        suite_passed = 0
-        suite_failed = 0
         results = []
-        
-        for case in cases:
-            passed, details = self.run_test_case(case, l, delta)
+        # Per-case outcomes land in a preallocated flat array and are
+        # reduced to counters once after the loop, instead of N attribute
+        # increments (bytearray stands in when NumPy is absent)
+        if _NUMPY_AVAILABLE:
+            res = np.empty(len(cases), dtype=bool)
+        else:
+            res = bytearray(len(cases))
+
+        # Prime the per-(l, delta) window template once for the whole suite
+        self.checker._prep(l, delta)
+
+        # Encode every input once up front (AoS -> SoA): the checkers then
+        # work on contiguous uint8 buffers instead of re-encoding per call.
+        # Done per suite, inside the caller's exception guard, so one bad
+        # case only aborts its own suite
+        if _NUMPY_AVAILABLE:
+            for case in cases:
+                case['_arr'] = np.frombuffer(
+                    case['input'].encode('ascii'), dtype=np.uint8
+                ) - 48
+
+        # Batched fast path: concatenate all inputs into one uint8 array and
+        # check the whole suite with a single vectorized call, falling back to
+        # per-case dispatch when NumPy (and thus the batch method) is absent
+        batch = None
+        if _NUMPY_AVAILABLE and cases and hasattr(self.checker, 'is_locally_balanced_batch'):
+            inputs = np.concatenate([case['_arr'] for case in cases])
+            offsets = np.cumsum([0] + [len(case['input']) for case in cases])
+            batch = self.checker.is_locally_balanced_batch(
+                inputs, offsets, l, delta, max_violations=None,
+                collect=self.collect_violations)
+
+        # Large suites without a batched result are embarrassingly parallel:
+        # fan the cases out over a process pool (the per-case work is pure
+        # CPython, so threads would not help) and merge in submission order
+        outcomes = None
+        if batch is None and len(cases) >= _PARALLEL_MIN_CASES:
+            workers = os.cpu_count() or 1
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=_init_worker) as executor:
+                outcomes = list(executor.map(
+                    functools.partial(_run_one, l=l, delta=delta,
+                                      collect_violations=self.collect_violations),
+                    cases,
+                    chunksize=max(1, len(cases) // (4 * workers))
+                ))
+
+        for i, case in enumerate(cases):
+            if outcomes is not None:
+                passed, details = outcomes[i]
+            else:
+                if batch is not None:
+                    precomputed = (bool(batch[0][i]), batch[1][i])
+                else:
+                    precomputed = None
+                passed, details = self.run_test_case(case, l, delta, precomputed)
             results.append(details)
-            
+            res[i] = passed
+
             if passed:
-                suite_passed += 1
-                self.passed += 1
-                status = "PASS"
                 symbol = "[PASS]"
             else:
-                suite_failed += 1
-                self.failed += 1
-                status = "FAIL"
                 symbol = "[FAIL]"
-                self.errors.append(details)
-            
-            # Print result
-            print("\n{0} Test {1}: {2}".format(
-                symbol, details['id'], details.get('note', '')
-            ))
-            print("  Input: {0} (length {1})".format(
-                details['input'], details['length']
-            ))
-            print("  Expected: {0}, Got: {1}".format(
-                details['expected'], details.get('actual', 'ERROR')
-            ))
+                # Retain only the fields the failure report prints, not the
+                # whole TestResult (violations lists included)
+                if CAPTURE_ERRORS:
+                    self.errors.append((
+                        details.id, details.note, details.input,
+                        details.expected, details.actual, details.error
+                    ))
             
-            if not passed and 'violations' in details and details['violations']:
-                print("  Violations found:")
-                for v in details['violations'][:3]:  # Show first 3 violations
-                    print("    - {0}".format(v))
-                if len(details['violations']) > 3:
-                    print("    ... and {0} more".format(len(details['violations']) - 3))
-            
-            if 'error' in details:
-                print("  Error: {0}".format(details['error']))
-        
-        print("\n{0}Suite Summary: {1}/{2} passed{3}".format(
-            "-" * 80 + "\n",
-            suite_passed,
-            suite_passed + suite_failed,
-            "\n" + "-" * 80
-        ))
-        
+            # Buffer result lines; per-case detail is skipped entirely when
+            # not verbose (e.g. CI runs that only want the summary)
+            if self.verbose:
+                out.write(f"\n{symbol} Test {details.id}: {details.note}\n")
+                out.write(f"  Input: {details.input} (length {details.length})\n")
+                got = details.actual if details.error is None else 'ERROR'
+                out.write(f"  Expected: {details.expected}, Got: {got}\n")
+
+                if not passed and details.violations:
+                    out.write("  Violations found:\n")
+                    for v in details.violations[:3]:  # Show first 3 violations
+                        out.write(f"    - {v}\n")
+                    if len(details.violations) > 3:
+                        out.write(f"    ... and {len(details.violations) - 3} more\n")
+
+                if details.error is not None:
+                    out.write(f"  Error: {details.error}\n")
+
+        # Single reduction over the outcome array
+        suite_passed = int(res.sum()) if _NUMPY_AVAILABLE else sum(res)
+        suite_failed = len(res) - suite_passed
+        self.passed += suite_passed
+        self.failed += suite_failed
+
+        out.write(
+            f"\n{_DASH80}\n"
+            f"Suite Summary: {suite_passed}/{suite_passed + suite_failed} passed"
+            f"\n{_DASH80}\n"
+        )
+
+        # One write syscall for the whole suite, then reset the buffer
+        sys.stdout.write(out.getvalue())
+        out.seek(0)
+        out.truncate()
+
         return {
             'suite_name': suite_name,
             'parameters': params,
@@ -159,44 +401,64 @@ class TestRunner:
         Returns:
             Overall results dictionary
         """
-        print("\n" + "=" * 80)
+        print("\n" + _EQ80)
         print("GOLDEN TEST CASE VERIFICATION")
-        print("=" * 80)
+        print(_EQ80)
         
         if 'meta' in test_data:
             print("\nTest Metadata:")
             for key, value in test_data['meta'].items():
-                print("  {0}: {1}".format(key, value))
+                print(f"  {key}: {value}")
         
         suite_results = []
-        
+
         for suite in test_data.get('test_suites', []):
-            result = self.run_test_suite(suite)
+            # The one exception guard in the run: per-case control flow uses
+            # sentinel returns, so anything raised here is a genuine fault
+            try:
+                result = self.run_test_suite(suite)
+            except Exception as e:
+                n_cases = len(suite.get('cases', []))
+                self.failed += n_cases
+                self._out.seek(0)
+                self._out.truncate()
+                print(f"\nSuite {suite.get('suite_name', '?')} aborted: {e!r}")
+                result = {
+                    'suite_name': suite.get('suite_name', '?'),
+                    'parameters': suite.get('parameters', {}),
+                    'passed': 0,
+                    'failed': n_cases,
+                    'total': n_cases,
+                    'results': [],
+                    'error': repr(e)
+                }
             suite_results.append(result)
-        
+
+        # Don't hold memoized test data beyond this run
+        self.checker.clear_cache()
+
         # Overall summary
-        print("\n" + "=" * 80)
+        print("\n" + _EQ80)
         print("OVERALL SUMMARY")
-        print("=" * 80)
-        print("Total Tests Passed: {0}".format(self.passed))
-        print("Total Tests Failed: {0}".format(self.failed))
-        print("Total Tests Run: {0}".format(self.passed + self.failed))
-        print("Success Rate: {0:.1f}%".format(
-            100.0 * self.passed / (self.passed + self.failed) if (self.passed + self.failed) > 0 else 0
-        ))
+        print(_EQ80)
+        print(f"Total Tests Passed: {self.passed}")
+        print(f"Total Tests Failed: {self.failed}")
+        print(f"Total Tests Run: {self.passed + self.failed}")
+        total = self.passed + self.failed
+        rate = 100.0 * self.passed / total if total > 0 else 0
+        print(f"Success Rate: {rate:.1f}%")
         
-        if self.failed > 0:
-            print("\n" + "=" * 80)
+        if self.failed > 0 and self.errors:
+            print("\n" + _EQ80)
             print("FAILED TEST DETAILS")
-            print("=" * 80)
-            for err in self.errors:
-                print("\nTest {0}: {1}".format(err['id'], err.get('note', '')))
-                print("  Input: {0}".format(err['input']))
-                print("  Expected: {0}, Got: {1}".format(
-                    err['expected'], err.get('actual', 'ERROR')
-                ))
-                if 'error' in err:
-                    print("  Error: {0}".format(err['error']))
+            print(_EQ80)
+            for err_id, note, input_str, expected, actual, error in self.errors:
+                print(f"\nTest {err_id}: {note}")
+                print(f"  Input: {input_str}")
+                got = actual if error is None else 'ERROR'
+                print(f"  Expected: {expected}, Got: {got}")
+                if error is not None:
+                    print(f"  Error: {error}")
         
         return {
             'total_passed': self.passed,
@@ -206,15 +468,18 @@ class TestRunner:
 
 
 def load_golden_tests(filename):
-    """Load test cases from JSON file"""
+    """Load test cases from JSON file (orjson when available, stdlib otherwise)"""
     try:
+        if _ORJSON_AVAILABLE:
+            with open(filename, 'rb') as f:
+                return orjson.loads(f.read())
         with open(filename, 'r') as f:
             return json.load(f)
     except IOError as e:
-        print("Error loading test file: {0}".format(e))
+        print(f"Error loading test file: {e}")
         return None
-    except json.JSONDecodeError as e:
-        print("Error parsing JSON: {0}".format(e))
+    except (json.JSONDecodeError, ValueError) as e:
+        print(f"Error parsing JSON: {e}")
         return None
 
 